@@ -20,7 +20,7 @@ with local:
 
     with st.echo():
         with st.expander("View the repo license with help from FilesConnection"):
-            license = conn.read('../LICENSE', input_format='text')
+            license = conn.read('../LICENSE', input_format='text', nbytes=64 * 1024)
             license
 
 with s3:
@@ -54,21 +54,15 @@ with s3:
                 text_file = f"{s3_bucket}/test.txt"
                 csv_file = f"{s3_bucket}/test.csv"
                 parquet_file = f"{s3_bucket}/test.parquet"
-                try:
-                    _ = conn.read(text_file, input_format='text')
-                except FileNotFoundError:
+                if not conn.exists(text_file):
                     with conn.open(text_file, "wt") as f:
                         f.write("This is a test")
                 
-                try:
-                    _ = conn.read(csv_file, input_format='csv')
-                except FileNotFoundError:
+                if not conn.exists(csv_file):
                     with conn.open(csv_file, "wt") as f:
                         df.to_csv(f, index=False)
                 
-                try:
-                    _ = conn.read(parquet_file, input_format='parquet')
-                except FileNotFoundError:
+                if not conn.exists(parquet_file):
                     with conn.open(parquet_file, "wb") as f:
                         df.to_parquet(f)
 
@@ -129,21 +123,15 @@ with gcs:
                 text_file = f"{gcs_bucket}/test3.txt"
                 csv_file = f"{gcs_bucket}/test3.csv"
                 parquet_file = f"{gcs_bucket}/test3.parquet"
-                try:
-                    _ = conn.read(text_file, input_format='text')
-                except FileNotFoundError:
+                if not conn.exists(text_file):
                     with conn.open(text_file, "wt") as f:
                         f.write("This is a test")
                 
-                try:
-                    _ = conn.read(csv_file, input_format='csv')
-                except FileNotFoundError:
+                if not conn.exists(csv_file):
                     with conn.open(csv_file, "wt") as f:
                         df.to_csv(f, index=False)
                 
-                try:
-                    _ = conn.read(parquet_file, input_format='parquet')
-                except FileNotFoundError:
+                if not conn.exists(parquet_file):
                     with conn.open(parquet_file, "wb") as f:
                         df.to_parquet(f)
 
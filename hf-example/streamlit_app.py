@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 import streamlit as st
 from st_files_connection import FilesConnection
@@ -22,6 +23,17 @@ There's probably some cool stuff to do with
 
 conn = st.experimental_connection('hf', type=FilesConnection)
 
+@st.cache_resource
+def get_prefetch_executor():
+    return ThreadPoolExecutor(max_workers=2)
+
+def read_kwargs(datafile, nrows):
+    kwargs = dict(nrows=nrows, ttl=3600)
+    # a single json object doesn't have rows to limit
+    if datafile.suffix == '.json':
+        del(kwargs['nrows'])
+    return kwargs
+
 with st.expander('Find dataset examples'):
     if 'dataset' not in st.session_state:
         st.session_state.dataset = "EleutherAI/lambada_openai"
@@ -56,22 +68,43 @@ file_selection = st.selectbox("Pick a data file", file_names)
 datafile = Path(dataset, file_selection)
 nrows = st.slider("Rows to retrieve", value=50)
 
+# Big datasets are often sharded into many parquet files in the same folder
+shards = [
+    f for f in file_names
+    if Path(f).parent == Path(file_selection).parent and Path(f).suffix == '.parquet'
+]
+read_all_shards = (
+    datafile.suffix == '.parquet'
+    and len(shards) > 1
+    and st.checkbox(f"Preview rows across all {len(shards)} parquet shards in this folder")
+)
+
 "## Dataset Preview"
-kwargs = dict(nrows=nrows, ttl=3600)
-
-# parquet doesn't neatly support nrows
-# could be fixed with something like this:
-# https://stackoverflow.com/a/69888274/20530083
-if datafile.suffix in ('.parquet', '.json'):
-    del(kwargs['nrows'])
-
-try:
-    df = conn.read(datafile, **kwargs)
-except JSONDecodeError as e:
-    # often times because a .json file is really .jsonl
+kwargs = read_kwargs(datafile, nrows)
+
+if read_all_shards:
+    df = conn.read_many([Path(dataset, f) for f in shards], **kwargs)
+else:
     try:
-        df = conn.read(datafile, input_format='jsonl', nrows=nrows, **kwargs)
-    except:
-        raise e
+        df = conn.read(datafile, **kwargs)
+    except JSONDecodeError as e:
+        # often times because a .json file is really .jsonl
+        try:
+            df = conn.read(datafile, input_format='jsonl', nrows=nrows, **kwargs)
+        except:
+            raise e
 
 st.dataframe(df.head(nrows), use_container_width=True)
+
+# Users often step through neighbouring files next, so warm the connection's
+# read cache for them in the background while they look at this one
+if 'prefetched' not in st.session_state:
+    st.session_state.prefetched = set()
+
+selected = file_names.index(file_selection)
+for neighbour in file_names[max(selected - 1, 0):selected + 2]:
+    if neighbour == file_selection or (dataset_name, neighbour, nrows) in st.session_state.prefetched:
+        continue
+    st.session_state.prefetched.add((dataset_name, neighbour, nrows))
+    next_datafile = Path(dataset, neighbour)
+    get_prefetch_executor().submit(conn.read, next_datafile, **read_kwargs(next_datafile, nrows))
@@ -3,8 +3,7 @@ from pathlib import Path
 
 @st.cache_data(ttl=3600)
 def get_files(_conn, dataset):
-    relevant_exts = ('**.csv', '**.jsonl', '**.parquet', '**.json')
-    relevant_files = []
-    for ext in relevant_exts:
-        relevant_files.extend(_conn.fs.glob(str(Path(dataset, ext))))
+    relevant_exts = ('.csv', '.jsonl', '.parquet', '.json')
+    # One recursive listing instead of a glob round-trip per extension
+    relevant_files = [f for f in _conn.fs.find(str(dataset)) if Path(f).suffix in relevant_exts]
     return [f.replace(str(dataset) + '/', '') for f in relevant_files]
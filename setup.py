@@ -18,7 +18,7 @@ VERSION = "0.1.0"  # PEP-440
 
 NAME = "st-files-connection"
 
-INSTALL_REQUIRES = ["streamlit>=1.22", "fsspec"]
+INSTALL_REQUIRES = ["streamlit>=1.22", "fsspec", "pyarrow>=10", "pandas>=1.5"]
 
 
 setuptools.setup(
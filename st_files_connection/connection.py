@@ -14,11 +14,21 @@
 
 from __future__ import annotations
 
+import codecs
+from collections import OrderedDict
+import copy
 from datetime import timedelta
+import functools
+import hashlib
+import itertools
 from io import TextIOWrapper
 import json
+import os
+import pickle
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterator, Optional, Union, overload
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union, overload
 from typing_extensions import Literal
 
 import pandas as pd
@@ -27,9 +37,674 @@ from streamlit.connections import ExperimentalBaseConnection
 from streamlit.runtime.caching import cache_data
 
 if TYPE_CHECKING:
-    from fsspec import AbstractFileSystem, filesystem
+    import pyarrow as pa
+    import pyarrow.fs
+    import pyarrow.parquet as pq
+    from fsspec import AbstractFileSystem
     from fsspec.spec import AbstractBufferedFile
 
+# Where persistent=True DataFrame results are stored, as Feather (Arrow IPC) files
+_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "st-files-connection")
+# Oldest files beyond this many are removed whenever a new one is written
+_DISK_CACHE_MAX_FILES = 256
+
+
+@functools.lru_cache(maxsize=None)
+def _available_protocols() -> frozenset:
+    """fsspec's known protocols - memoized, since listing them scans package entry points."""
+    from fsspec import available_protocols
+
+    return frozenset(available_protocols())
+
+
+# fsspec (s3fs) option name -> pyarrow.fs.S3FileSystem option name
+_S3_ARROW_OPTIONS = {
+    "key": "access_key",
+    "secret": "secret_key",
+    "token": "session_token",
+    "anon": "anonymous",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_s3_region(bucket: str) -> Optional[str]:
+    """A bucket's region, which pyarrow (unlike s3fs) won't discover from redirects."""
+    from pyarrow.fs import resolve_s3_region
+
+    try:
+        return resolve_s3_region(bucket)
+    except (OSError, ValueError):
+        # e.g. no network access or bucket is missing - leave it to the default region
+        return None
+
+
+def _arrow_filesystem(protocol: str, options: dict, bucket: str) -> "Optional[pyarrow.fs.FileSystem]":
+    """Translate fsspec options into an equivalent native pyarrow FileSystem for bucket.
+
+    Returns None when the protocol has no native Arrow implementation, or when
+    any option can't be mapped (so we never silently drop credentials or config).
+    """
+    if protocol in ("s3", "s3a"):
+        arrow_options = {}
+        for name, value in options.items():
+            if name in _S3_ARROW_OPTIONS:
+                arrow_options[_S3_ARROW_OPTIONS[name]] = value
+            elif name == "endpoint_url":
+                scheme, sep, endpoint = value.partition("://")
+                if sep:
+                    arrow_options["scheme"] = scheme
+                    arrow_options["endpoint_override"] = endpoint
+                else:
+                    arrow_options["endpoint_override"] = value
+            elif name == "client_kwargs" and set(value) <= {"region_name"}:
+                if "region_name" in value:
+                    arrow_options["region"] = value["region_name"]
+            else:
+                return None
+
+        if "region" not in arrow_options and "endpoint_override" not in arrow_options:
+            region = _resolve_s3_region(bucket)
+            if region is not None:
+                arrow_options["region"] = region
+
+        from pyarrow.fs import S3FileSystem
+
+        return S3FileSystem(**arrow_options)
+
+    if protocol in ("gcs", "gs"):
+        # Service account tokens (the secrets.toml case) have no Arrow equivalent
+        token = options.get("token")
+        if set(options) - {"token"} or token not in (None, "google_default", "anon"):
+            return None
+
+        from pyarrow.fs import GcsFileSystem
+
+        return GcsFileSystem(anonymous=token == "anon")
+
+    return None
+
+
+def _file_version(info: dict) -> str:
+    """Pick whatever field identifies a file revision from an fsspec info() dict."""
+    keys = (
+        "ETag", "etag", "blob_id", "generation", "md5Hash", "md5",
+        "mtime", "LastModified", "updated", "last_modified",
+    )
+    for key in keys:
+        if info.get(key) is not None:
+            return str(info[key])
+    return str(info.get("size"))
+
+
+def _normalize_filters(filters) -> list[list[tuple]]:
+    """Return pyarrow-style DNF filters as a list of AND-ed predicate lists."""
+    if not filters:
+        return []
+    if isinstance(filters[0][0], str):
+        return [list(filters)]
+    return [list(conjunction) for conjunction in filters]
+
+
+def _may_match(bounds: Optional[tuple], op: str, value: Any) -> bool:
+    """Whether a column chunk with (min, max) bounds may hold rows matching a predicate.
+
+    Errs on the side of True whenever the statistics can't answer the question.
+    """
+    if bounds is None:
+        return True
+    low, high = bounds
+    try:
+        if op in ("=", "=="):
+            return low <= value <= high
+        if op == "!=":
+            return not (low == high == value)
+        if op == "<":
+            return low < value
+        if op == "<=":
+            return low <= value
+        if op == ">":
+            return high > value
+        if op == ">=":
+            return high >= value
+        if op == "in":
+            return any(low <= v <= high for v in value)
+    except TypeError:
+        pass
+    return True
+
+
+def _matching_row_groups(metadata: "pq.FileMetaData", filters) -> list[int]:
+    """Indices of row groups whose footer statistics don't rule out the filters."""
+    dnf = _normalize_filters(filters)
+    matching = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        bounds = {}
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if column.is_stats_set and column.statistics.has_min_max:
+                bounds[column.path_in_schema] = (column.statistics.min, column.statistics.max)
+
+        if not dnf or any(
+            all(_may_match(bounds.get(name), op, value) for name, op, value in conjunction)
+            for conjunction in dnf
+        ):
+            matching.append(i)
+    return matching
+
+
+# Bounded, since every new version of a file adds an entry
+@cache_data(show_spinner=False, max_entries=256)
+def _read_parquet_metadata(_f, connection_name: str, path: str, version: str) -> "pq.FileMetaData":
+    """Parquet footer for a file, memoized on path + file version."""
+    import pyarrow.parquet as pq
+
+    return pq.read_metadata(_f)
+
+
+def _truncate_range_index(table: "pa.Table") -> "pa.Table":
+    """Shorten a RangeIndex recorded in the pandas metadata to the table's rows.
+
+    to_pandas() only restores a RangeIndex whose length matches the table, so without this
+    the first rows of a frame saved with e.g. index=range(100, 200) would get a 0..n-1 index.
+    """
+    metadata = table.schema.pandas_metadata
+    if not metadata:
+        return table
+    for index in metadata.get("index_columns", []):
+        if isinstance(index, dict) and index.get("kind") == "range":
+            index["stop"] = index["start"] + index["step"] * table.num_rows
+    return table.replace_schema_metadata({**table.schema.metadata, b"pandas": json.dumps(metadata).encode()})
+
+
+def _read_parquet_file(f, columns=None, filters=None, nrows=None, metadata=None) -> "pa.Table":
+    """Read a parquet file, skipping row groups the filters rule out via footer statistics.
+
+    With nrows, row groups are read one at a time until enough rows have been collected.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(f, metadata=metadata)
+    read_columns = columns
+    expression = None
+    if filters:
+        expression = pq.filters_to_expression(filters)
+        if columns is not None:
+            # Columns only needed to evaluate the filters get dropped again below
+            filter_columns = {name for conj in _normalize_filters(filters) for name, _, _ in conj}
+            read_columns = list(columns) + sorted(filter_columns - set(columns))
+
+    row_groups = _matching_row_groups(pf.metadata, filters)
+    if nrows is None:
+        table = pf.read_row_groups(row_groups, columns=read_columns, use_pandas_metadata=True)
+        if expression is not None:
+            table = table.filter(expression)
+    else:
+        tables = []
+        num_rows = 0
+        for i in row_groups:
+            if num_rows >= nrows:
+                break
+            row_group = pf.read_row_group(i, columns=read_columns, use_pandas_metadata=True)
+            if expression is not None:
+                row_group = row_group.filter(expression)
+            tables.append(row_group)
+            num_rows += row_group.num_rows
+        if not tables:
+            tables.append(pf.read_row_groups([], columns=read_columns, use_pandas_metadata=True))
+        table = pa.concat_tables(tables).slice(0, nrows)
+        if expression is None:
+            table = _truncate_range_index(table)
+
+    if read_columns is not columns:
+        extra = set(read_columns) - set(columns)
+        table = table.select([name for name in table.column_names if name not in extra])
+    return table
+
+
+def _read_parquet_dataset(
+    filesystem: "pyarrow.fs.FileSystem", path: str, is_dir: bool, columns=None, filters=None, nrows=None
+) -> "pa.Table":
+    """Read a directory of parquet files (or a single file with Expression filters) with pyarrow.dataset.
+
+    Shard footers are read in parallel and the filters and column projection are pushed
+    down to row group level. A `_metadata` summary file is used when the directory has one.
+    """
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    from pyarrow.fs import FileType
+
+    metadata_path = f"{path.rstrip('/')}/_metadata"
+    if is_dir and filesystem.get_file_info(metadata_path).type == FileType.File:
+        dataset = ds.parquet_dataset(metadata_path, filesystem=filesystem, partitioning="hive")
+    else:
+        dataset = ds.dataset(path, format="parquet", filesystem=filesystem, partitioning="hive")
+
+    expression = pq.filters_to_expression(filters) if filters is not None else None
+    scanner = dataset.scanner(columns=columns, filter=expression, batch_size=65536)
+    return scanner.to_table() if nrows is None else scanner.head(nrows)
+
+
+def _to_pandas(table: "pa.Table", dtype_backend: Optional[str] = None) -> pd.DataFrame:
+    """Convert an Arrow table to pandas on multiple threads, releasing Arrow memory as it goes.
+
+    The table must not be used afterwards. With dtype_backend="pyarrow" (as in pandas' own
+    readers) columns stay Arrow-backed via pd.ArrowDtype, avoiding the copy to NumPy.
+    """
+    return table.to_pandas(
+        use_threads=True,
+        self_destruct=True,
+        split_blocks=True,
+        types_mapper=pd.ArrowDtype if dtype_backend == "pyarrow" else None,
+    )
+
+
+def _arrow_csv_options(kwargs: dict) -> Optional[dict]:
+    """Map pandas read_csv kwargs onto pyarrow.csv options (as dicts of option kwargs).
+
+    Returns None if any kwarg has no Arrow equivalent, in which case the caller
+    should fall back to pandas.
+    """
+    import pyarrow as pa
+
+    from pandas._libs.parsers import STR_NA_VALUES
+
+    read_options = {"block_size": 8 << 20, "use_threads": True}
+    parse_options = {}
+    # Match pandas, which reads empty fields, "None", "<NA>" etc. as NaN rather than strings
+    convert_options = {"strings_can_be_null": True, "null_values": sorted(STR_NA_VALUES)}
+    for name, value in kwargs.items():
+        if name == "nrows" or (name == "dtype_backend" and value == "pyarrow"):
+            continue
+        elif name in ("sep", "delimiter") and isinstance(value, str) and len(value) == 1:
+            parse_options["delimiter"] = value
+        elif name == "usecols" and all(isinstance(col, str) for col in value):
+            convert_options["include_columns"] = list(value)
+        elif name == "dtype" and isinstance(value, dict):
+            column_types = {}
+            for col, dtype in value.items():
+                try:
+                    column_types[col] = pa.from_numpy_dtype(pd.api.types.pandas_dtype(dtype))
+                except (TypeError, pa.ArrowException):
+                    return None
+            convert_options["column_types"] = column_types
+        else:
+            return None
+
+    return {
+        "nrows": kwargs.get("nrows"),
+        "read_options": read_options,
+        "parse_options": parse_options,
+        "convert_options": convert_options,
+    }
+
+
+def _read_csv_file(
+    f, nrows=None, read_options=None, parse_options=None, convert_options=None
+) -> "Optional[pa.Table]":
+    """Parse a CSV with Arrow's multithreaded reader, giving the same columns and types as pd.read_csv.
+
+    With nrows, record batches are streamed until enough rows have been read. Returns None
+    for what is left to pandas: headers it would rename (blank or duplicate names), usecols
+    missing from the header and integers too large for int64.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv
+
+    read_options = read_options or {}
+    parse_options = parse_options or {}
+    convert_options = convert_options or {}
+
+    include_columns = convert_options.get("include_columns")
+    if include_columns is not None:
+        # pandas returns usecols in file order (and raises its own error for missing ones)
+        header = pd.read_csv(f, sep=parse_options.get("delimiter", ","), nrows=0).columns.tolist()
+        f.seek(0)
+        if set(include_columns) - set(header):
+            return None
+        convert_options = {**convert_options, "include_columns": [name for name in header if name in include_columns]}
+
+    def options(convert_options: dict) -> dict:
+        return {
+            "read_options": pa.csv.ReadOptions(**read_options),
+            "parse_options": pa.csv.ParseOptions(**parse_options),
+            "convert_options": pa.csv.ConvertOptions(**convert_options),
+        }
+
+    def has_renamed_headers(names: list[str]) -> bool:
+        return "" in names or len(set(names)) != len(names)
+
+    if nrows is not None:
+        # Arrow infers types from a whole block, pandas from just the rows it reads - so stream
+        # the first nrows rows as text, then parse those on their own below
+        reader = pa.csv.open_csv(f, **options(convert_options))
+        names = reader.schema.names
+        if has_renamed_headers(names):
+            return None
+        f.seek(0)
+        reader = pa.csv.open_csv(f, **options({**convert_options, "column_types": dict.fromkeys(names, pa.string())}))
+        batches = []
+        num_rows = 0
+        for batch in reader:
+            batches.append(batch)
+            num_rows += batch.num_rows
+            if num_rows >= nrows:
+                break
+        head = pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+        f = pa.BufferOutputStream()
+        pa.csv.write_csv(head, f)
+        f = pa.BufferReader(f.getvalue())
+        parse_options = {}
+
+    def read(convert_options: dict) -> "pa.Table":
+        return pa.csv.read_csv(f, **options(convert_options))
+
+    table = read(convert_options)
+    if has_renamed_headers(table.column_names):
+        return None
+
+    # pandas leaves dates and times as strings unless asked to parse them
+    column_types = convert_options.get("column_types", {})
+    as_strings = {
+        field.name: pa.string()
+        for field in table.schema
+        if pa.types.is_temporal(field.type) and field.name not in column_types
+    }
+    if as_strings:
+        f.seek(0)
+        table = read({**convert_options, "column_types": {**column_types, **as_strings}})
+
+    # pandas keeps integers beyond int64 exact (as uint64 or Python ints), where Arrow makes them doubles
+    for field in table.schema:
+        if pa.types.is_floating(field.type) and field.name not in column_types:
+            column = table.column(field.name)
+            largest = pc.max(pc.abs(column)).as_py()
+            if largest is not None and largest >= 2**63 and pc.all(pc.equal(pc.floor(column), column)).as_py():
+                return None
+
+    # ...and reads a column with no values as float NaN, where Arrow has a null type
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type) and field.name not in column_types:
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table
+
+
+class _Unfreezable(Exception):
+    """Raised by _freeze for a value it can't turn into a reliable cache key."""
+
+
+def _freeze(value: Any) -> Any:
+    """Turn read() kwargs into something hashable, for use in a cache key.
+
+    Other objects (e.g. pyarrow Expressions, numpy arrays) are keyed on a digest of their
+    full contents, as their repr() may be truncated. Raises _Unfreezable if that fails.
+    """
+    import numpy as np
+
+    if isinstance(value, dict):
+        return tuple(sorted(((k, _freeze(v)) for k, v in value.items()), key=lambda item: str(item[0])))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        # Sorted, since a frozenset's repr (which names disk cache files) varies with PYTHONHASHSEED
+        return ("set", tuple(sorted((_freeze(v) for v in value), key=repr)))
+    if value is None or isinstance(value, (str, bytes, bool, int, float)):
+        # Tagged with the type, as 0 == False and 1 == 1.0 == True would otherwise share a key
+        return (type(value).__name__, value)
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        digest = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return ("ndarray", value.dtype.str, value.shape, digest)
+    try:
+        data = pickle.dumps(value)
+    except Exception as e:
+        raise _Unfreezable(type(value).__qualname__) from e
+    return (type(value).__module__, type(value).__qualname__, hashlib.sha256(data).hexdigest())
+
+
+class _ResultCache:
+    """Thread-safe, in-process LRU of read() results.
+
+    Results are held by reference, so unlike cache_data a hit costs no
+    (de)serialization - and callers share the same object.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, ttl: Optional[float]) -> tuple[bool, Any]:
+        """Return (hit, value), treating entries older than ttl seconds as missing."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            stored_at, value = entry
+            if ttl is not None and time.monotonic() - stored_at > ttl:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _disk_cache_files() -> list[str]:
+    """Feather files in the disk cache, oldest first."""
+    files = []
+    try:
+        entries = os.scandir(_DISK_CACHE_DIR)
+    except OSError:
+        return files
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".feather"):
+                try:
+                    files.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
+    return [path for _, path in sorted(files)]
+
+
+def _remove_files(paths: list[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            # Already removed, e.g. by another process pruning at the same time
+            pass
+
+
+def _read_jsonl_file(f, nrows=None) -> "pa.Table":
+    """Parse JSON lines with Arrow's multithreaded reader.
+
+    With nrows, only the first nrows lines are read from f.
+    """
+    import pyarrow as pa
+    import pyarrow.json
+
+    if nrows is not None:
+        f = pa.BufferReader(b"".join(itertools.islice(f, nrows)))
+    return pa.json.read_json(f, read_options=pa.json.ReadOptions(block_size=8 << 20, use_threads=True))
+
+
+def _infer_input_format(path: str | Path) -> str:
+    """Infer input_format from the file extension of path, e.g. "csv" for "data/file.CSV"."""
+    name = str(path).rpartition("/")[2]
+    stem, dot, suffix = name.rpartition(".")
+    if not (dot and stem):
+        return ""
+    suffix = suffix.lower()
+    return "text" if suffix == "txt" else suffix
+
+
+def _read_text(conn: FilesConnection, path: str | Path, **kwargs) -> str:
+    nbytes = kwargs.pop("nbytes", None)
+    encoding = kwargs.pop("encoding", None) or "utf-8"
+    errors = kwargs.pop("errors", None) or "strict"
+    newline = kwargs.pop("newline", None)
+
+    if kwargs:
+        # Other options (e.g. compression=, block_size=) are for open(), not every cat_file accepts them
+        with conn.open(path, "rb", **kwargs) as f:
+            data = f.read() if nbytes is None else f.read(nbytes)
+    elif nbytes is None:
+        # Fetch the bytes in one go and decode them once, rather than streaming
+        # through a TextIOWrapper, which holds bytes and str copies side by side
+        data = conn.fs.cat_file(str(path))
+    else:
+        # A single ranged request instead of downloading the whole file
+        data = conn.fs.read_block(str(path), 0, nbytes)
+
+    if nbytes is None:
+        text = data.decode(encoding, errors)
+    else:
+        # Not passing final=True drops a multi-byte character cut off by the range
+        text = codecs.getincrementaldecoder(encoding)(errors).decode(data)
+
+    # Universal newlines, same as opening the file in text mode
+    if newline is None:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_csv(conn: FilesConnection, path: str | Path, **kwargs) -> pd.DataFrame:
+    import pyarrow as pa
+
+    options = _arrow_csv_options(kwargs)
+    with conn.open(path, "rb") as f:
+        if options is not None:
+            try:
+                table = _read_csv_file(f, **options)
+            except pa.ArrowInvalid:
+                # Arrow infers column types from the first block, so a later
+                # block can fail to convert - let pandas have a go instead
+                table = None
+            if table is not None:
+                return _to_pandas(table, kwargs.get("dtype_backend"))
+            f.seek(0)
+        return pd.read_csv(f, **kwargs)
+
+
+def _read_parquet(conn: FilesConnection, path: str | Path, info: Optional[dict] = None, **kwargs) -> pd.DataFrame:
+    columns = kwargs.pop("columns", None)
+    filters = kwargs.pop("filters", None)
+    nrows = kwargs.pop("nrows", None)
+    dtype_backend = kwargs.get("dtype_backend")
+    if set(kwargs) - {"dtype_backend"} or dtype_backend not in (None, "pyarrow"):
+        # Other pandas / pyarrow options aren't handled by the row group reader
+        with conn.open(path, "rb") as f:
+            df = pd.read_parquet(f, columns=columns, filters=filters, **kwargs)
+        return df if nrows is None else df.head(nrows)
+
+    import pyarrow.compute as pc
+
+    if info is None:
+        info = conn.fs.info(str(path))
+    is_dir = info["type"] == "directory"
+    if is_dir or isinstance(filters, pc.Expression):
+        # Shard discovery and filter pushdown are left to pyarrow.dataset
+        table = conn._read_arrow_native(
+            path,
+            lambda filesystem, source: _read_parquet_dataset(filesystem, source, is_dir, columns, filters, nrows),
+        )
+        return _to_pandas(table, dtype_backend)
+
+    version = _file_version(info)
+    with conn._open_input_file(path) as f:
+        metadata = _read_parquet_metadata(f, conn._connection_name, str(path), version)
+        table = _read_parquet_file(f, columns, filters, nrows, metadata)
+    return _to_pandas(table, dtype_backend)
+
+
+def _read_json(conn: FilesConnection, path: str | Path, **kwargs) -> Any:
+    # json.loads detects and decodes UTF-8/16/32 bytes itself
+    return json.loads(conn.fs.cat_file(str(path)), **kwargs)
+
+
+def _read_jsonl(conn: FilesConnection, path: str | Path, **kwargs) -> pd.DataFrame:
+    import pyarrow as pa
+
+    with conn.open(path, "rb") as f:
+        # Arrow parses timestamp strings and types all-null fields differently from pandas,
+        # so it's only used when Arrow-backed columns were asked for
+        if set(kwargs) <= {"nrows", "dtype_backend"} and kwargs.get("dtype_backend") == "pyarrow":
+            try:
+                return _to_pandas(_read_jsonl_file(f, kwargs.get("nrows")), "pyarrow")
+            except pa.ArrowInvalid:
+                # e.g. a field whose type changes between blocks - let pandas have a go instead
+                f.seek(0)
+        kwargs['lines'] = True
+        return pd.read_json(f, **kwargs)
+
+
+def _read_native(conn: FilesConnection, path: str | Path, input_format: str, **kwargs) -> pd.DataFrame:
+    """Hand the path straight to pandas, skipping conn.open().
+
+    Parquet is read through the native Arrow filesystem when there is one. Otherwise pandas
+    gets the URL and storage options, and does its own remote access through fsspec.
+    """
+    url = conn.fs.unstrip_protocol(str(path))
+    storage_options = conn.get_storage_options() or None
+    if input_format == "parquet":
+        return conn._read_arrow_native(
+            path,
+            lambda filesystem, source: pd.read_parquet(source, engine="pyarrow", filesystem=filesystem, **kwargs),
+            lambda: pd.read_parquet(url, engine="pyarrow", storage_options=storage_options, **kwargs),
+        )
+    if input_format == "csv":
+        return pd.read_csv(url, storage_options=storage_options, **kwargs)
+    return pd.read_json(url, lines=True, storage_options=storage_options, **kwargs)
+
+
+_READERS = {
+    "text": _read_text,
+    "csv": _read_csv,
+    "parquet": _read_parquet,
+    "json": _read_json,
+    "jsonl": _read_jsonl,
+}
+
+
+def _read(conn: FilesConnection, path: str | Path, input_format: str, info: Optional[dict] = None, **kwargs) -> Any:
+    """Dispatch to the reader for input_format. info is the file's fs.info(), if already known."""
+    if kwargs.pop("native", False):
+        return _read_native(conn, path, input_format, **kwargs)
+    if input_format == "parquet":
+        return _read_parquet(conn, path, info=info, **kwargs)
+    return _READERS[input_format](conn, path, **kwargs)
+
+
+@cache_data(show_spinner="Running `files.read(...)`.", max_entries=256)
+def _read_cached(
+    _conn: FilesConnection,
+    _kwargs: dict,
+    path: str,
+    input_format: str,
+    connection_name: str,
+    ttl_bucket: Optional[int],
+    kwargs_key: Any,
+) -> Any:
+    """cache_data'd read, decorated once rather than on every read() call.
+
+    connection_name is only passed to make the cache connection-specific. ttl_bucket
+    changes every `ttl` seconds, which expires entries without needing a per-ttl decorator.
+    The reader kwargs are passed unhashed, with kwargs_key (their frozen form) standing in
+    for them, so cache_data only ever hashes primitives.
+    """
+    return _read(_conn, path, input_format, **_kwargs)
+
 
 class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
     """Connects a streamlit app to arbitrary file storage
@@ -42,14 +717,14 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
         self, connection_name: str = "default", protocol: str | None = None, **kwargs
     ) -> None:
         self.protocol = protocol
+        self._arrow_fs_cache: dict = {}
         super().__init__(connection_name, **kwargs)
 
     def _connect(self, **kwargs) -> "AbstractFileSystem":
         """
         Pass a protocol such as "s3", "gcs", or "file"
         """
-        from fsspec import AbstractFileSystem, filesystem, available_protocols
-        from fsspec.spec import AbstractBufferedFile
+        from fsspec import filesystem
 
         secrets = self._secrets.to_dict()
         protocol = secrets.pop("protocol", self.protocol)
@@ -58,8 +733,11 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
 
         if protocol is None:
             # Check if name maps to a protocol known by fsspec
-            # (allows developers to use name == protocol for shorthand)
-            if self._connection_name in available_protocols():
+            # (allows developers to use name == protocol for shorthand).
+            # Local names are answered without listing fsspec's protocols.
+            if self._connection_name in ("file", "local"):
+                protocol = self._connection_name
+            elif self._connection_name in _available_protocols():
                 protocol = self._connection_name
             else:
                 protocol = "file"
@@ -71,16 +749,65 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
             self.protocol = protocol
         
         secrets.update(kwargs)
+        self._fs_options = secrets
+        self._arrow_fs_cache = {}
+        self._result_cache = _ResultCache()
 
-        fs = filesystem(protocol, **secrets)
-
-        return fs
+        # fsspec reuses instances created with the same arguments (unless skip_instance_cache=True)
+        return filesystem(protocol, **secrets)
     
     @property
     def fs(self) -> "AbstractFileSystem":
         """Access the underlying AbstractFileSystem for full API operations."""
         return self._instance
 
+    def _arrow_fs(self, path: str | Path) -> "Optional[pyarrow.fs.FileSystem]":
+        """Native pyarrow FileSystem for reading path, if one can be built.
+
+        Only S3 and GCS are supported, and only when every configured option has
+        an Arrow equivalent. Returns None otherwise, in which case reads go through fsspec.
+        S3 filesystems are built per bucket, since pyarrow needs each bucket's region.
+        """
+        bucket = self.fs._strip_protocol(str(path)).split("/", 1)[0] if self.protocol in ("s3", "s3a") else ""
+        if bucket not in self._arrow_fs_cache:
+            self._arrow_fs_cache[bucket] = _arrow_filesystem(self.protocol, self._fs_options, bucket)
+        return self._arrow_fs_cache[bucket]
+
+    def _fsspec_handler(self) -> "pyarrow.fs.FileSystem":
+        """This connection's fsspec filesystem wrapped for Arrow."""
+        from pyarrow.fs import FSSpecHandler, PyFileSystem
+
+        return PyFileSystem(FSSpecHandler(self.fs))
+
+    def _read_arrow_native(
+        self,
+        path: str | Path,
+        read: Callable[["pyarrow.fs.FileSystem", str], Any],
+        fallback: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Call read(filesystem, stripped path) with the native Arrow filesystem, falling back to fsspec.
+
+        fallback() is called if there is no native filesystem or reading through it raises OSError.
+        It defaults to calling read() with this connection's fsspec filesystem wrapped for Arrow.
+        """
+        arrow_fs = self._arrow_fs(path)
+        source = self.fs._strip_protocol(str(path))
+        if arrow_fs is not None:
+            try:
+                return read(arrow_fs, source)
+            except OSError:
+                # e.g. credentials or public bucket access that only fsspec handles
+                pass
+        if fallback is None:
+            return read(self._fsspec_handler(), source)
+        return fallback()
+
+    def _open_input_file(self, path: str | Path):
+        """Open path for binary reading, natively through Arrow when possible."""
+        return self._read_arrow_native(
+            path, lambda filesystem, source: filesystem.open_input_file(source), lambda: self.open(path, "rb")
+        )
+
     def open(
         self, path: str | Path, mode: str = "rb", *args, **kwargs
     ) -> Iterator[TextIOWrapper | AbstractBufferedFile]:
@@ -92,12 +819,30 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
 
         return self.fs.open(path, mode, *args, **kwargs)
 
+    def get_storage_options(self) -> dict:
+        """Return this connection's filesystem options in the form pandas / pyarrow `storage_options=` expect."""
+        return copy.deepcopy(self._fs_options)
+
+    def clear_cache(self) -> None:
+        """Drop cached read() results: this connection's in-memory cache and every `persistent=True` result.
+
+        The on-disk cache and `st.cache_data` entries are shared, so this clears them for all connections.
+        """
+        self._result_cache.clear()
+        _read_cached.clear()
+        _remove_files(_disk_cache_files())
+
+    def exists(self, path: str | Path) -> bool:
+        """Check whether the specified path exists, without downloading it."""
+        return self.fs.exists(str(path))
+
     @overload
     def read(
         self,
         path: str | Path,
         input_format: Literal["text"],
         ttl: Optional[Union[float, int, timedelta]] = None,
+        persistent: bool = False,
         **kwargs,
     ) -> str:
         pass
@@ -108,6 +853,7 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
         path: str | Path,
         input_format: Literal["json"],
         ttl: Optional[Union[float, int, timedelta]] = None,
+        persistent: bool = False,
         **kwargs,
     ) -> Any:
         pass
@@ -118,6 +864,10 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
         path: str | Path,
         input_format: Literal["csv", "parquet", "jsonl"],
         ttl: Optional[Union[float, int, timedelta]] = None,
+        columns: Optional[list[str]] = None,
+        filters: Optional[list] = None,
+        persistent: bool = False,
+        native: bool = False,
         **kwargs,
     ) -> pd.DataFrame:
         pass
@@ -127,6 +877,10 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
         path: str | Path,
         input_format: str = None,
         ttl: Optional[Union[float, int, timedelta]] = None,
+        columns: Optional[list[str]] = None,
+        filters: Optional[list] = None,
+        persistent: bool = False,
+        native: bool = False,
         **kwargs,
     ):
         """Read the file at the specified path, cache the result and return as a pandas DataFrame.
@@ -134,68 +888,142 @@ class FilesConnection(ExperimentalBaseConnection["AbstractFileSystem"]):
         input_format may be specified - valid values are `text`, `csv`, `parquet`, `json`, `jsonl`.
         If not specified, input_format will be inferred optimistically from path file extension.
         Result is cached indefinitely by default, set `ttl = 0` to disable caching.
+
+        Results are cached in memory for this connection, keyed on the file's current ETag / mtime,
+        and the same object is returned on every hit - copy it before mutating. Set `persistent=True`
+        to cache on disk instead (DataFrames are stored as LZ4 compressed Feather files under
+        `~/.cache/st-files-connection`, other results go through Streamlit's `cache_data`).
+
+        For text, `nbytes` limits the read to the first n bytes of the file.
+
+        For parquet, `columns` limits which columns are fetched and `filters` takes pyarrow
+        style DNF filters, e.g. `[("year", ">=", 2020)]`, or a `pyarrow.compute.Expression`.
+        Row groups whose footer statistics rule out the filters are skipped entirely. `path`
+        may also be a directory of parquet files, which are read as one dataset.
+
+        DataFrame formats accept pandas' `dtype_backend="pyarrow"` to keep columns Arrow-backed.
+        For jsonl this also reads with Arrow's JSON parser, which infers types differently from
+        pandas (e.g. timestamp strings are parsed as timestamps).
+
+        Set `native=True` to skip `open()` and hand the path to pandas, with any other kwargs passed
+        to the pandas reader as-is. Parquet on S3/GCS is read through pyarrow's native filesystem
+        where the connection options allow it; otherwise pandas gets the URL and
+        `get_storage_options()`, and reads through fsspec itself.
         """
-        @cache_data(ttl=ttl, show_spinner="Running `files.read(...)`.")
-        def _read_text(path: str | Path, **kwargs) -> str:
-            if "connection_name" in kwargs:
-                kwargs.pop("connection_name")
-
-            with self.open(path, "rt", **kwargs) as f:
-                return f.read()
-
-        @cache_data(ttl=ttl, show_spinner="Running `files.read(...)`.")
-        def _read_csv(path: str | Path, **kwargs) -> pd.DataFrame:
-            if "connection_name" in kwargs:
-                kwargs.pop("connection_name")
-
-            with self.open(path, "rt") as f:
-                return pd.read_csv(f, **kwargs)
-
-        @cache_data(ttl=ttl, show_spinner="Running `files.read(...)`.")
-        def _read_parquet(path: str | Path, **kwargs) -> pd.DataFrame:
-            # TODO: for general read() user may commonly pass `nrows` which isn't supported by read_parquet
-            # Can we add something like this as a workaround? https://stackoverflow.com/a/69888274/20530083
-            if "connection_name" in kwargs:
-                kwargs.pop("connection_name")
-
-            with self.open(path, "rb") as f:
-                return pd.read_parquet(f, **kwargs)
-
-        @cache_data(ttl=ttl, show_spinner="Running `files.read(...)`.")
-        def _read_json(path: str | Path, **kwargs) -> Any:
-            if "connection_name" in kwargs:
-                kwargs.pop("connection_name")
-
-            with self.open(path, "rt") as f:
-                return json.load(f, **kwargs)
-
-        @cache_data(ttl=ttl, show_spinner="Running `files.read(...)`.")
-        def _read_jsonl(path: str | Path, **kwargs) -> pd.DataFrame:
-            if "connection_name" in kwargs:
-                kwargs.pop("connection_name")
-
-            kwargs['lines'] = True
-            with self.open(path, "rt") as f:
-                return pd.read_json(f, **kwargs)
-
-        # Try to infer input_format from file extension if missing
+        if columns is not None:
+            kwargs["columns"] = columns
+        if filters is not None:
+            kwargs["filters"] = filters
+
         if input_format is None:
-            # You can construct a Path from a Path so this should work regardless
-            input_format = Path(path).suffix.replace('.', '', 1)
-            if input_format == 'txt':
-                input_format = 'text'
-
-        if input_format == 'text':
-            return _read_text(path, connection_name=self._connection_name, **kwargs)
-        elif input_format == 'csv':
-            return _read_csv(path, connection_name=self._connection_name, **kwargs)
-        elif input_format == 'parquet':
-            return _read_parquet(path, connection_name=self._connection_name, **kwargs)
-        elif input_format == 'json':
-            return _read_json(path, connection_name=self._connection_name, **kwargs)
-        elif input_format == 'jsonl':
-            return _read_jsonl(path, connection_name=self._connection_name, **kwargs)
-        raise ValueError(f"{input_format} is not a valid value for `input_format=`.")
+            input_format = _infer_input_format(path)
+
+        if input_format not in _READERS:
+            raise ValueError(f"{input_format} is not a valid value for `input_format=`.")
+        if native:
+            if input_format not in ("csv", "parquet", "jsonl"):
+                raise ValueError(f"`native=True` is not supported for `input_format={input_format}`.")
+            kwargs["native"] = True
+
+        if isinstance(ttl, timedelta):
+            ttl = ttl.total_seconds()
+        if ttl == 0:
+            return _read(self, path, input_format, **kwargs)
+        try:
+            kwargs_key = _freeze(kwargs)
+        except _Unfreezable:
+            # Without a reliable key one read could be served another's result, so don't cache
+            return _read(self, path, input_format, **kwargs)
+
+        if persistent:
+            if input_format in ("csv", "parquet", "jsonl"):
+                info = self.fs.info(str(path))
+                return self._read_through_disk_cache(input_format, path, ttl, kwargs, kwargs_key, info)
+            ttl_bucket = None if ttl is None else int(time.time() // ttl)
+            return _read_cached(
+                self, kwargs, str(path), input_format, self._connection_name, ttl_bucket, kwargs_key
+            )
+
+        info = self.fs.info(str(path))
+        key = (input_format, str(path), _file_version(info), kwargs_key)
+        hit, result = self._result_cache.get(key, ttl)
+        if not hit:
+            result = _read(self, path, input_format, info=info, **kwargs)
+            self._result_cache.set(key, result)
+        return result
+
+    def read_many(
+        self,
+        paths: list[str | Path],
+        input_format: Literal["csv", "parquet", "jsonl"] = None,
+        ttl: Optional[Union[float, int, timedelta]] = None,
+        nrows: Optional[int] = None,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Read several files concurrently and concatenate them into a single pandas DataFrame.
+
+        Files are read `max_workers` at a time, in order, with the same arguments as `read()`.
+        With `nrows`, reading stops once enough rows have been collected, and each file is
+        only asked for the rows still missing - so for parquet shards typically just the
+        first row group of the first few files is fetched.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        frames = []
+        num_rows = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(paths), max_workers):
+                if nrows is not None:
+                    if num_rows >= nrows:
+                        break
+                    kwargs["nrows"] = nrows - num_rows
+
+                batch = paths[start:start + max_workers]
+                for df in executor.map(lambda path: self.read(path, input_format, ttl, **kwargs), batch):
+                    frames.append(df)
+                    num_rows += len(df)
+
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        return df if nrows is None else df.head(nrows)
+
+    def _read_through_disk_cache(
+        self, input_format: str, path: str | Path, ttl: Optional[float], kwargs: dict, kwargs_key: Any, info: dict
+    ) -> pd.DataFrame:
+        """Read a DataFrame through the on-disk Feather cache.
+
+        Entries are keyed on the source file's version and expire by the cache file's mtime.
+        """
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        key = (self._connection_name, self.protocol, input_format, str(path), _file_version(info), kwargs_key)
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        cache_file = os.path.join(_DISK_CACHE_DIR, f"{digest}.feather")
+
+        try:
+            age = time.time() - os.path.getmtime(cache_file)
+        except OSError:
+            age = None
+        if age is not None and (ttl is None or age < ttl):
+            return _to_pandas(feather.read_table(cache_file, memory_map=True), kwargs.get("dtype_backend"))
+
+        df = _read(self, path, input_format, info=info, **kwargs)
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+            feather.write_feather(df, tmp_file, compression="lz4")
+            os.replace(tmp_file, cache_file)
+        except (pa.ArrowException, ValueError, TypeError, OSError):
+            # Not everything fits in Feather (e.g. non-string column names) - just skip caching
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        else:
+            # Files for older versions of the source are never read again, so keep the cache bounded
+            _remove_files(_disk_cache_files()[:-_DISK_CACHE_MAX_FILES])
+        return df
 
     def _repr_html_(self) -> str:
         """Return a human-friendly markdown string describing this connection.
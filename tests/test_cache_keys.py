@@ -0,0 +1,73 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pyarrow.compute as pc
+import pytest
+
+from st_files_connection.connection import _file_version, _freeze, _Unfreezable
+
+
+@pytest.mark.parametrize("a, b", [(0, False), (1, True), (1, 1.0), (None, "None")])
+def test_equal_scalars_of_different_types_get_distinct_keys(a, b):
+    assert _freeze({"x": a}) != _freeze({"x": b})
+
+
+def test_long_expressions_get_distinct_keys():
+    values = list(range(1000))
+    a = pc.field("x").isin(values)
+    b = pc.field("x").isin(values[:-1] + [-1])
+    assert _freeze({"filters": a}) != _freeze({"filters": b})
+    assert _freeze({"filters": a}) == _freeze({"filters": pc.field("x").isin(values)})
+
+
+def test_large_arrays_get_distinct_keys():
+    a = np.arange(10_000)
+    b = a.copy()
+    b[5_000] = -1
+    assert _freeze(a) != _freeze(b)
+    assert _freeze(a) != _freeze(a.astype("int32"))
+    assert _freeze(a) != _freeze(a.reshape(100, 100))
+    assert _freeze(a) == _freeze(np.arange(10_000))
+
+
+def test_unpicklable_values_are_not_frozen():
+    with pytest.raises(_Unfreezable):
+        _freeze({"converters": {"a": lambda x: x}})
+
+
+@pytest.mark.parametrize("info, expected", [
+    ({"blob_id": "abc", "size": 1}, "abc"),
+    ({"generation": "17", "md5Hash": "xyz", "size": 1}, "17"),
+    ({"md5Hash": "xyz", "size": 1}, "xyz"),
+    ({"size": 1}, "1"),
+])
+def test_file_version(info, expected):
+    assert _file_version(info) == expected
+
+
+def test_set_keys_are_stable_across_processes():
+    code = "from st_files_connection.connection import _freeze; print(repr(_freeze({'usecols': set('abcdefgh')})))"
+    reprs = {
+        subprocess.run(
+            [sys.executable, "-c", code], env={**os.environ, "PYTHONHASHSEED": seed}, capture_output=True, text=True
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(reprs) == 1 and reprs.pop().startswith("((")
+    assert _freeze({"a", "b"}) == _freeze({"b", "a"})
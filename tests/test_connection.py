@@ -0,0 +1,29 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from st_files_connection import FilesConnection
+
+
+def test_filesystem_instances_follow_fsspec_caching():
+    assert FilesConnection("memory").fs is FilesConnection("memory").fs
+    assert FilesConnection("memory", skip_instance_cache=True).fs is not FilesConnection("memory").fs
+
+
+def test_kwargs_that_compare_equal_are_cached_separately(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("i,v\n1,2\n")
+    conn = FilesConnection("local")
+    assert conn.read(path, index_col=0).columns.tolist() == ["v"]
+    assert conn.read(path, index_col=False).columns.tolist() == ["i", "v"]
@@ -0,0 +1,61 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from st_files_connection.connection import _arrow_csv_options, _read_csv_file, _to_pandas
+
+
+def read_arrow(data: bytes, **kwargs):
+    table = _read_csv_file(BytesIO(data), **_arrow_csv_options(kwargs))
+    return None if table is None else _to_pandas(table)
+
+
+@pytest.mark.parametrize("data", [
+    b"a,b,c\n1,x,0.5\n2,,1.5\n3,z,\n",
+    b"day,ts,t\n2020-01-01,2020-01-01 10:00:00,10:00:00\n2021-06-30,2021-06-30 23:59:59,23:59:59\n",
+    b"a,empty\n1,\n2,\n",
+    b"flag,n\nTrue,1\nfalse,0\n",
+    b"a,b\n1,None\n2,<NA>\n3,x\n",
+    b'a,b\n1,"x,y"\n2.5,z\n',
+])
+@pytest.mark.parametrize("kwargs", [{}, {"nrows": 1}])
+def test_matches_pandas(data, kwargs):
+    pd.testing.assert_frame_equal(read_arrow(data, **kwargs), pd.read_csv(BytesIO(data), **kwargs))
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"usecols": ["a", "c"], "dtype": {"a": "float64"}},
+    {"usecols": ["c", "a"]},
+])
+def test_usecols_and_dtype(kwargs):
+    data = b"a,b,c\n1,x,0.5\n2,y,1.5\n"
+    pd.testing.assert_frame_equal(read_arrow(data, **kwargs), pd.read_csv(BytesIO(data), **kwargs))
+
+
+@pytest.mark.parametrize("data", [
+    b",a\n0,1\n",
+    b"a,a,b\n1,2,3\n",
+    b"big,n\n9223372036854775808,1\n1,2\n",
+    b"big,n\n18446744073709551616,1\n1,2\n",
+])
+def test_left_to_pandas(data):
+    assert read_arrow(data) is None
+
+
+def test_missing_usecols_are_left_to_pandas():
+    assert read_arrow(b"a,b\n1,2\n", usecols=["a", "z"]) is None
@@ -0,0 +1,63 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pandas as pd
+import pytest
+
+from st_files_connection import FilesConnection
+from st_files_connection import connection
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(connection, "_DISK_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def test_changed_file_is_read_again(tmp_path, cache_dir):
+    conn = FilesConnection("local")
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+    assert conn.read(path, persistent=True)["a"].tolist() == [1]
+
+    path.write_text("a\n1\n2\n")
+    os.utime(path, (0, 12345))
+    assert conn.read(path, persistent=True)["a"].tolist() == [1, 2]
+
+
+def test_cache_is_pruned_and_cleared(tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setattr(connection, "_DISK_CACHE_MAX_FILES", 2)
+    conn = FilesConnection("local")
+    for i in range(4):
+        path = tmp_path / f"{i}.csv"
+        pd.DataFrame({"a": [i]}).to_csv(path, index=False)
+        conn.read(path, persistent=True)
+    assert len(os.listdir(cache_dir)) == 2
+
+    conn.clear_cache()
+    assert os.listdir(cache_dir) == []
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"dtype_backend": "pyarrow"}])
+def test_hit_returns_the_same_frame_as_miss(tmp_path, cache_dir, kwargs):
+    conn = FilesConnection("local")
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,\n")
+    miss = conn.read(path, persistent=True, **kwargs)
+    hit = conn.read(path, persistent=True, **kwargs)
+    assert os.listdir(cache_dir)
+    pd.testing.assert_frame_equal(hit, miss)
@@ -0,0 +1,34 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+
+from st_files_connection import FilesConnection
+
+DATA = '{"a": 1, "ts": "2020-01-01 10:00:00", "empty": null}\n{"a": 2, "ts": "2021-06-30 23:59:59", "empty": null}\n'
+
+
+def test_default_matches_pandas(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text(DATA)
+    df = FilesConnection("local").read(path, ttl=0)
+    pd.testing.assert_frame_equal(df, pd.read_json(path, lines=True))
+
+
+def test_arrow_backed(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text(DATA)
+    df = FilesConnection("local").read(path, ttl=0, nrows=1, dtype_backend="pyarrow")
+    assert len(df) == 1
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
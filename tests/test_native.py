@@ -0,0 +1,60 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+import pytest
+from pyarrow.fs import LocalFileSystem, SubTreeFileSystem
+
+from st_files_connection import FilesConnection
+from st_files_connection import connection
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"a": [1, 2, 3]}).to_parquet(path)
+    return path
+
+
+@pytest.fixture
+def read_parquet_calls(monkeypatch):
+    calls = []
+    original = pd.read_parquet
+
+    def read_parquet(path, **kwargs):
+        calls.append(kwargs)
+        return original(path, **kwargs)
+
+    monkeypatch.setattr(connection.pd, "read_parquet", read_parquet)
+    return calls
+
+
+def test_parquet_uses_arrow_filesystem(parquet_file, read_parquet_calls):
+    conn = FilesConnection("local")
+    conn._arrow_fs_cache[""] = LocalFileSystem()
+    df = conn.read(parquet_file, ttl=0, native=True)
+    assert df["a"].tolist() == [1, 2, 3]
+    assert isinstance(read_parquet_calls[0]["filesystem"], LocalFileSystem)
+    assert "storage_options" not in read_parquet_calls[0]
+
+
+def test_parquet_falls_back_to_storage_options(tmp_path, parquet_file, read_parquet_calls):
+    conn = FilesConnection("local")
+    # Resolves paths under an empty directory, so the native read fails
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    conn._arrow_fs_cache[""] = SubTreeFileSystem(str(empty), LocalFileSystem())
+    df = conn.read(parquet_file, ttl=0, native=True)
+    assert df["a"].tolist() == [1, 2, 3]
+    assert "filesystem" not in read_parquet_calls[-1]
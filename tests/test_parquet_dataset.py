@@ -0,0 +1,84 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+from pyarrow.fs import LocalFileSystem, SubTreeFileSystem
+
+from st_files_connection import FilesConnection
+
+
+@pytest.fixture
+def shards(tmp_path):
+    directory = tmp_path / "shards"
+    directory.mkdir()
+    for i in range(3):
+        df = pd.DataFrame({"a": range(i * 10, i * 10 + 10), "b": [f"s{i}"] * 10})
+        df.to_parquet(directory / f"part-{i}.parquet", index=False)
+    return directory
+
+
+@pytest.fixture(params=["fsspec", "native", "native_error"])
+def conn(request, tmp_path):
+    conn = FilesConnection("local")
+    if request.param == "native":
+        conn._arrow_fs_cache[""] = LocalFileSystem()
+    elif request.param == "native_error":
+        # Resolves paths under an empty directory, so reads fall back to fsspec
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        conn._arrow_fs_cache[""] = SubTreeFileSystem(str(empty), LocalFileSystem())
+    return conn
+
+
+def test_directory(conn, shards):
+    df = conn.read(shards, input_format="parquet", ttl=0)
+    pd.testing.assert_frame_equal(df, pd.read_parquet(shards))
+
+
+def test_directory_columns_filters_nrows(conn, shards):
+    df = conn.read(shards, input_format="parquet", ttl=0, columns=["a"], filters=[("a", ">=", 15)], nrows=7)
+    expected = pd.read_parquet(shards, columns=["a"], filters=[("a", ">=", 15)]).head(7)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_metadata_summary_file(conn, shards):
+    metadata = []
+    for path in sorted(shards.iterdir()):
+        md = pq.read_metadata(path)
+        md.set_file_path(path.name)
+        metadata.append(md)
+    for md in metadata[1:]:
+        metadata[0].append_row_groups(md)
+    pq.write_metadata(pq.read_schema(shards / "part-0.parquet"), shards / "_metadata", metadata_collector=[metadata[0]])
+    # Not listed in _metadata, so not part of the dataset
+    pd.DataFrame({"a": [-1], "b": ["extra"]}).to_parquet(shards / "part-3.parquet", index=False)
+
+    df = conn.read(shards, input_format="parquet", ttl=0)
+    expected = pd.concat([pd.read_parquet(shards / f"part-{i}.parquet") for i in range(3)], ignore_index=True)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+@pytest.mark.parametrize("nrows", [None, 3])
+def test_expression_filter_on_file(conn, tmp_path, nrows):
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.table({"a": range(100), "b": [str(i) for i in range(100)]}), path, row_group_size=10)
+    expression = (pc.field("a") > 42) & (pc.field("b") != "50")
+    df = conn.read(path, ttl=0, filters=expression, nrows=nrows)
+    expected = pd.read_parquet(path, filters=expression)
+    pd.testing.assert_frame_equal(df, expected if nrows is None else expected.head(nrows))
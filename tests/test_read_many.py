@@ -0,0 +1,52 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pandas as pd
+import pytest
+
+from st_files_connection import FilesConnection
+
+
+@pytest.fixture
+def shards(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"part-{i}.parquet"
+        pd.DataFrame({"a": range(i * 3, i * 3 + 3)}).to_parquet(path, index=False)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("nrows", [None, 1, 6, 7, 14, 100])
+def test_read_many(shards, nrows):
+    df = FilesConnection("local").read_many(shards, ttl=0, nrows=nrows, max_workers=2)
+    expected = pd.concat([pd.read_parquet(path) for path in shards], ignore_index=True)
+    pd.testing.assert_frame_equal(df, expected if nrows is None else expected.head(nrows))
+
+
+def test_read_many_stops_once_nrows_are_read(shards, monkeypatch):
+    conn = FilesConnection("local")
+    read = conn.read
+    calls = []
+
+    def spy(path, *args, **kwargs):
+        calls.append((path, kwargs.get("nrows")))
+        return read(path, *args, **kwargs)
+
+    monkeypatch.setattr(conn, "read", spy)
+    conn.read_many(shards, ttl=0, nrows=7, max_workers=2)
+    # Two full files from the first window, then one more row asked of each file in the second
+    calls.sort(key=lambda call: str(call[0]))
+    assert calls == [(shards[0], 7), (shards[1], 7), (shards[2], 1), (shards[3], 1)]
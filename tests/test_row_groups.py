@@ -0,0 +1,117 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from st_files_connection.connection import _matching_row_groups, _may_match, _read_parquet_file, _to_pandas
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    """10 row groups of 10 rows: a = 0..99, b = "s00".."s99", c constant per row group."""
+    table = pa.table({
+        "a": list(range(100)),
+        "b": [f"s{i:02d}" for i in range(100)],
+        "c": [i // 10 for i in range(100)],
+    })
+    path = tmp_path / "t.parquet"
+    pq.write_table(table, path, row_group_size=10)
+    return path
+
+
+@pytest.mark.parametrize("op, value, expected", [
+    ("=", 10, True),
+    ("==", 20, True),
+    ("=", 15, True),
+    ("=", 9, False),
+    ("=", 21, False),
+    ("<", 10, False),
+    ("<", 11, True),
+    ("<=", 10, True),
+    (">", 20, False),
+    (">", 19, True),
+    (">=", 20, True),
+    ("in", [1, 10], True),
+    ("in", [20, 30], True),
+    ("in", [1, 21], False),
+    ("in", [], False),
+])
+def test_may_match_bounds(op, value, expected):
+    assert _may_match((10, 20), op, value) is expected
+
+
+def test_may_match_not_equal():
+    # Only a chunk where every value equals the excluded one can be skipped
+    assert _may_match((5, 5), "!=", 5) is False
+    assert _may_match((5, 6), "!=", 5) is True
+    assert _may_match((5, 5), "!=", 6) is True
+
+
+def test_may_match_keeps_row_group_when_unsure():
+    assert _may_match(None, "=", 1) is True
+    # Mixed-type statistics vs value can't be compared
+    assert _may_match((1, 9), "=", "5") is True
+    assert _may_match(("a", "z"), "in", [1, 2]) is True
+    # Operators the statistics can't answer
+    assert _may_match((1, 9), "not in", [1]) is True
+
+
+def test_matching_row_groups(parquet_path):
+    metadata = pq.read_metadata(parquet_path)
+    assert _matching_row_groups(metadata, None) == list(range(10))
+    assert _matching_row_groups(metadata, [("a", ">=", 95)]) == [9]
+    assert _matching_row_groups(metadata, [("a", "=", 10)]) == [1]
+    assert _matching_row_groups(metadata, [("c", "!=", 3)]) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert _matching_row_groups(metadata, [("b", "in", ["s05", "s42"])]) == [0, 4]
+    # AND within a group
+    assert _matching_row_groups(metadata, [("a", ">=", 15), ("a", "<", 25)]) == [1, 2]
+    assert _matching_row_groups(metadata, [("a", ">=", 15), ("c", "=", 5)]) == [5]
+    # OR across groups
+    assert _matching_row_groups(metadata, [[("a", "<", 2)], [("a", "in", [50])]]) == [0, 5]
+    assert _matching_row_groups(metadata, [[("a", "<", 0)], [("b", "=", "s99")]]) == [9]
+    # Unknown column or uncomparable value never drops a row group
+    assert _matching_row_groups(metadata, [("missing", "=", 1)]) == list(range(10))
+    assert _matching_row_groups(metadata, [("a", "=", "x")]) == list(range(10))
+
+
+@pytest.mark.parametrize("filters", [
+    [("a", "=", 10)],
+    [("c", "!=", 3)],
+    [("b", "in", ["s05", "s42", "zzz"])],
+    [[("a", "<", 2)], [("a", "in", [50])], [("b", ">", "s97")]],
+])
+def test_read_parquet_file_matches_full_scan(parquet_path, filters):
+    expected = pq.read_table(parquet_path, filters=filters)
+    with open(parquet_path, "rb") as f:
+        table = _read_parquet_file(f, filters=filters)
+    assert table.equals(expected)
+
+
+def test_read_parquet_file_nrows_and_filter_columns(parquet_path):
+    with open(parquet_path, "rb") as f:
+        table = _read_parquet_file(f, columns=["b"], filters=[("a", ">", 55)], nrows=3)
+    assert table.column_names == ["b"]
+    assert table.column("b").to_pylist() == ["s56", "s57", "s58"]
+
+
+@pytest.mark.parametrize("index", [range(100, 200), range(200, 0, -2)])
+def test_read_parquet_file_nrows_keeps_range_index(tmp_path, index):
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"a": range(100)}, index=index).to_parquet(path, row_group_size=10)
+    with open(path, "rb") as f:
+        df = _to_pandas(_read_parquet_file(f, nrows=15))
+    pd.testing.assert_frame_equal(df, pd.read_parquet(path).head(15))
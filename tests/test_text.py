@@ -0,0 +1,35 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gzip
+
+from st_files_connection import FilesConnection
+
+
+def test_nbytes_drops_cut_off_character(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes("aé\r\nb".encode())
+    conn = FilesConnection("local")
+    assert conn.read(path, input_format="text", ttl=0, nbytes=2) == "a"
+    assert conn.read(path, input_format="text", ttl=0, nbytes=5) == "aé\n"
+    assert conn.read(path, input_format="text", ttl=0, nbytes=5, newline="") == "aé\r\n"
+
+
+def test_open_options(tmp_path):
+    path = tmp_path / "data.txt.gz"
+    path.write_bytes(gzip.compress(b"hello\r\nworld"))
+    conn = FilesConnection("local")
+    assert conn.read(path, input_format="text", ttl=0, compression="gzip") == "hello\nworld"
+    assert conn.read(path, input_format="text", ttl=0, compression="gzip", nbytes=5) == "hello"